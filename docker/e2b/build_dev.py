@@ -1,13 +1,19 @@
 import asyncio
+import os
 from e2b import AsyncTemplate, default_build_logger
 from template import template
 
+# E2B reuses cached layers from previous builds of the same template unless
+# told otherwise; set E2B_SKIP_CACHE=1 to force a clean rebuild
+SKIP_CACHE = os.getenv("E2B_SKIP_CACHE", "").lower() in ("1", "true", "yes")
+
 
 async def main():
     await AsyncTemplate.build(
         template,
         alias="roma-dspy-sandbox-dev",
         on_build_logs=default_build_logger(),
+        skip_cache=SKIP_CACHE,
     )
 
 
@@ -4,6 +4,21 @@
 
 echo "[Startup] Starting E2B sandbox with S3 support..."
 
+# Materialize AWS credentials at runtime (not build time) so key rotation
+# doesn't invalidate the template build cache or leak into layer history
+mkdir -p /root/.aws /home/user/.aws
+if [ -n "$AWS_ACCESS_KEY_ID" ] && [ -n "$AWS_SECRET_ACCESS_KEY" ]; then
+    printf '[default]\naws_access_key_id = %s\naws_secret_access_key = %s\n' \
+        "$AWS_ACCESS_KEY_ID" "$AWS_SECRET_ACCESS_KEY" > /root/.aws/credentials
+    printf '[default]\nregion = %s\noutput = json\n' "${AWS_REGION:-us-east-1}" > /root/.aws/config
+    cp /root/.aws/credentials /home/user/.aws/credentials
+    cp /root/.aws/config /home/user/.aws/config
+    chmod 600 /root/.aws/credentials /home/user/.aws/credentials
+    echo "[Startup] AWS credentials configured from environment"
+else
+    echo "[Startup] No AWS credentials provided - S3 mounting will be skipped"
+fi
+
 # Mount S3 in background if configured (non-blocking, parallel with Jupyter)
 if [ -n "$S3_BUCKET_NAME" ]; then
     echo "[Startup] Mounting S3 bucket: $S3_BUCKET_NAME to $STORAGE_BASE_PATH (async)"
@@ -2,6 +2,8 @@ import os
 from e2b import AsyncTemplate
 
 # Read environment variables from host at build time
+# AWS credentials are only passed through as envs; start_jupyter.sh writes
+# ~/.aws/credentials from them at sandbox startup
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID", "")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY", "")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
@@ -14,38 +16,36 @@ template = (
     AsyncTemplate()
     .from_template("code-interpreter-v1")
     .set_user("root")
-    # Set environment variables from host
+    # Set non-secret environment variables from host
+    # Secrets are set last so rotating them does not invalidate the cached layers below
     .set_envs({
         "AWS_REGION": AWS_REGION,
         "S3_MOUNT_DIR": STORAGE_BASE_PATH,
         "S3_BUCKET_NAME": S3_BUCKET_NAME,
-        "AWS_ACCESS_KEY_ID": AWS_ACCESS_KEY_ID,
-        "AWS_SECRET_ACCESS_KEY": AWS_SECRET_ACCESS_KEY,
         "STORAGE_BASE_PATH": STORAGE_BASE_PATH,
     })
-    # Install system packages
-    .run_cmd("apt-get update")
-    .run_cmd("apt-get install -y curl wget fuse ca-certificates jq && apt-get clean && rm -rf /var/lib/apt/lists/* && rm -rf /tmp/* && rm -rf /var/tmp/*")
-    # Install goofys for S3 mounting
-    .run_cmd("curl -L https://github.com/kahing/goofys/releases/latest/download/goofys -o /usr/local/bin/goofys && chmod +x /usr/local/bin/goofys")
-    # Configure FUSE
-    .run_cmd('echo "user_allow_other" >> /etc/fuse.conf')
-    # Setup AWS credentials directories
-    # Note: Environment variables set above are accessible in shell commands via $VAR
-    .run_cmd('mkdir -p /root/.aws /home/user/.aws && if [ -n "$AWS_ACCESS_KEY_ID" ] && [ -n "$AWS_SECRET_ACCESS_KEY" ]; then echo "[default]" > /root/.aws/credentials && echo "aws_access_key_id = $AWS_ACCESS_KEY_ID" >> /root/.aws/credentials && echo "aws_secret_access_key = $AWS_SECRET_ACCESS_KEY" >> /root/.aws/credentials && echo "[default]" > /root/.aws/config && echo "region = $AWS_REGION" >> /root/.aws/config && echo "output = json" >> /root/.aws/config && cp /root/.aws/credentials /home/user/.aws/credentials && cp /root/.aws/config /home/user/.aws/config && chmod 600 /root/.aws/credentials /home/user/.aws/credentials && echo "AWS credentials configured from environment"; else echo "No AWS credentials provided - S3 mounting will be skipped"; fi')
     # Install uv for faster package installation
     .run_cmd("pip install --no-cache-dir uv")
     # Install Python requirements using uv
+    # Only requirements.txt is copied here so unchanged deps hit the build cache
     .copy("requirements.txt", "/tmp/requirements.txt")
     .run_cmd("uv pip install --system --no-cache -r /tmp/requirements.txt && rm /tmp/requirements.txt")
-    # Create directories using environment variable
-    .run_cmd(f'mkdir -p /workspace "${{STORAGE_BASE_PATH}}"')
-    # Copy S3 mount script
+    # Install system packages (update + install in one layer so the package index is never stale)
+    .run_cmd("apt-get update && apt-get install -y --no-install-recommends curl wget fuse ca-certificates jq && apt-get clean && rm -rf /var/lib/apt/lists/* /tmp/* /var/tmp/*")
+    # Install goofys for S3 mounting and configure FUSE
+    .run_cmd('curl -L https://github.com/kahing/goofys/releases/latest/download/goofys -o /usr/local/bin/goofys && chmod +x /usr/local/bin/goofys && echo "user_allow_other" >> /etc/fuse.conf')
+    # Copy S3 mount script and runtime startup script
     .copy("mount_s3.sh", "/usr/local/bin/mount_s3.sh")
-    .run_cmd("chmod +x /usr/local/bin/mount_s3.sh")
-    # Copy runtime startup script
     .copy("start_jupyter.sh", "/root/start_jupyter.sh")
-    .run_cmd("chmod +x /root/start_jupyter.sh")
+    # Create directories and make scripts executable in a single layer
+    .run_cmd(f'mkdir -p /workspace "${{STORAGE_BASE_PATH}}" && chmod +x /usr/local/bin/mount_s3.sh /root/start_jupyter.sh')
+    # Set AWS credentials LAST: key rotation only invalidates the layers from here on
+    # The credentials file is written at runtime by start_jupyter.sh so secrets never
+    # land in a build layer
+    .set_envs({
+        "AWS_ACCESS_KEY_ID": AWS_ACCESS_KEY_ID,
+        "AWS_SECRET_ACCESS_KEY": AWS_SECRET_ACCESS_KEY,
+    })
     # Set working directory
     .set_workdir("/workspace")
 )
@@ -58,5 +58,5 @@ if S3_BUCKET_NAME:
     # Graceful: if S3_BUCKET_NAME is empty, skip S3 check
     template = template.set_start_cmd(
         start_cmd="/root/start_jupyter.sh",
-        ready_cmd='curl -s http://localhost:49999/health > /dev/null && ([ -f /opt/sentient/.e2b_ready ] || [ -z "$S3_BUCKET_NAME" ])'
+        ready_cmd='curl -sf http://localhost:49999/health > /dev/null && ([ -f /opt/sentient/.e2b_ready ] || [ -z "$S3_BUCKET_NAME" ])'
     )
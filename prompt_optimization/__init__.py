@@ -16,17 +16,22 @@ from .optimizer import create_optimizer
 
 
 # Lazy import for dataset_loaders (requires 'datasets' library which is optional)
+_DATASET_FUNCTIONS = frozenset({
+    "load_aimo_datasets",
+    "load_frames_dataset",
+    "load_seal0_dataset",
+    "load_simpleqa_verified_dataset",
+})
+
+
 def __getattr__(name):
     """Lazy import for dataset loader functions that require the 'datasets' library."""
-    _dataset_functions = {
-        "load_aimo_datasets",
-        "load_frames_dataset",
-        "load_seal0_dataset",
-        "load_simpleqa_verified_dataset",
-    }
-    if name in _dataset_functions:
+    if name in _DATASET_FUNCTIONS:
         from . import dataset_loaders
-        return getattr(dataset_loaders, name)
+        value = getattr(dataset_loaders, name)
+        # Cache on the module so later lookups bypass __getattr__ entirely
+        globals()[name] = value
+        return value
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
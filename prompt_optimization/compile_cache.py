@@ -0,0 +1,128 @@
+"""Disk cache for optimizer compile() results.
+
+GEPA compiles make many LM calls, so re-running an experiment with the same seed
+program, data, metric and optimizer settings can reuse the previous result. The
+cache stores the optimized predictor states (instructions + demos) as JSON, keyed
+by a blake2b digest over everything that determines the compile.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import dspy
+from loguru import logger
+
+from prompt_optimization.config import OptimizationConfig
+
+# Config fields that only affect logging/output or test-time evaluation, not compile()
+_NON_COMPILE_FIELDS = frozenset({
+    "test_size",
+    "max_parallel",
+    "track_stats",
+    "track_best_outputs",
+    "log_dir",
+    "use_mlflow",
+    "use_wandb",
+    "wandb_project",
+    "wandb_entity",
+    "wandb_api_key",
+    "wandb_tags",
+    "wandb_notes",
+    "enable_logging",
+    "output_path",
+    "env_file",
+    "compile_cache_dir",
+})
+
+
+def predictor_state(program: dspy.Module) -> Dict[str, Any]:
+    """
+    Collect the state of every predictor exposed by `program.named_predictors()`.
+
+    RecursiveSolverModule only surfaces its agents' predictors through
+    named_predictors(), so Module.dump_state() would miss them.
+    """
+    return {name: predictor.dump_state() for name, predictor in program.named_predictors()}
+
+
+def compile_cache_key(
+    program: dspy.Module,
+    trainset: Sequence[dspy.Example],
+    valset: Sequence[dspy.Example],
+    config: OptimizationConfig,
+    **extra: Any,
+) -> str:
+    """
+    Build the cache key for compiling `program` on the given data and settings.
+
+    Args:
+        program: Student program before compilation (its seed prompts and demos)
+        trainset: Training examples
+        valset: Validation examples
+        config: Optimization config (output/observability fields are ignored)
+        **extra: Anything else that changes the result (profile, metric name, ...)
+
+    Returns:
+        Hex digest identifying the compile
+    """
+    settings = {k: v for k, v in asdict(config).items() if k not in _NON_COMPILE_FIELDS}
+    payload = {
+        "program": predictor_state(program),
+        "trainset": [example.toDict() for example in trainset],
+        "valset": [example.toDict() for example in valset],
+        "settings": settings,
+        "extra": extra,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def load_compiled(program: dspy.Module, cache_dir: str, key: str) -> Optional[dspy.Module]:
+    """
+    Load a cached compile result into `program` in place.
+
+    Args:
+        program: Freshly built student program to receive the optimized state
+        cache_dir: Cache directory
+        key: Key from compile_cache_key()
+
+    Returns:
+        `program` with the cached predictor states applied, or None on a cache miss
+    """
+    path = Path(cache_dir) / f"{key}.json"
+    if not path.exists():
+        return None
+
+    state = json.loads(path.read_text(encoding="utf-8"))
+    predictors = dict(program.named_predictors())
+    if set(state) != set(predictors):
+        logger.warning(f"Ignoring compile cache entry {path}: predictor names do not match")
+        return None
+
+    for name, predictor in predictors.items():
+        predictor.load_state(state[name])
+    return program
+
+
+def save_compiled(program: dspy.Module, cache_dir: str, key: str) -> Path:
+    """
+    Save the optimized predictor states of `program` under `key`.
+
+    Args:
+        program: Compiled program
+        cache_dir: Cache directory (created if missing)
+        key: Key from compile_cache_key()
+
+    Returns:
+        Path of the written cache entry
+    """
+    path = Path(cache_dir) / f"{key}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename so an interrupted run never leaves a truncated entry
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(predictor_state(program), default=str), encoding="utf-8")
+    tmp_path.replace(path)
+    return path
@@ -71,6 +71,9 @@ class OptimizationConfig:
     # Output
     output_path: Optional[str] = None
 
+    # Reuse compile() results across identical runs (None disables the cache)
+    compile_cache_dir: Optional[str] = None
+
     # Environment
     env_file: Optional[str] = "../../.env"  # Relative to experiment_cli dir or absolute path
 
@@ -1,11 +1,233 @@
-"""Dataset loaders for prompt optimization."""
+"""Dataset loaders for prompt optimization.
 
-import dspy
-from datasets import load_dataset
+Heavy dependencies (dspy, datasets, pandas, pyarrow) are imported inside the loaders
+so that importing this module, e.g. for CLI argument parsing, stays cheap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
 import random
-from typing import Optional, Tuple, List, Union
-import pandas as pd
+from functools import lru_cache, wraps
+from itertools import cycle, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    import dspy
+    import pandas as pd
+
+# Local cache for parsed remote tabular datasets (override with ROMA_PROMPT_OPT_CACHE_DIR)
+_DATASET_CACHE_DIR = Path(
+    os.getenv("ROMA_PROMPT_OPT_CACHE_DIR", Path.home() / ".cache" / "roma_prompt_opt")
+)
+
+
+def _memoize_dataset(maxsize: int = 4):
+    """
+    Memoize a dataset loader per process, keyed by its (hashable) arguments.
+
+    Repeated calls with the same dataset/sizes/seed skip loading entirely. Each call
+    gets fresh lists of shallow `dspy.Example` copies, so callers can reorder splits or
+    set fields on examples (e.g. attach a prediction) without affecting later loads.
+    Field values are not copied, so do not mutate them in place.
+    """
+    def copy_split(split):
+        return [example.copy() for example in split]
+
+    def decorator(fn):
+        cached = lru_cache(maxsize=maxsize)(fn)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            result = cached(*args, **kwargs)
+            if isinstance(result, tuple):
+                return tuple(copy_split(split) for split in result)
+            return copy_split(result)
+
+        wrapper.cache_clear = cached.cache_clear
+        wrapper.cache_info = cached.cache_info
+        return wrapper
+
+    return decorator
+
+
+def _read_csv_arrow(path: str, sep: str = ",") -> pd.DataFrame:
+    """
+    Read a CSV/TSV with Arrow's multithreaded CSV parser and convert to pandas.
+
+    Remote paths (e.g. hf://) are streamed through fsspec.
+    """
+    import pyarrow.csv as pacsv
+
+    parse_options = pacsv.ParseOptions(delimiter=sep, newlines_in_values=True)
+    convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+
+    if "://" in path:
+        import fsspec
+
+        with fsspec.open(path, "rb") as f:
+            table = pacsv.read_csv(f, parse_options=parse_options, convert_options=convert_options)
+    else:
+        table = pacsv.read_csv(path, parse_options=parse_options, convert_options=convert_options)
+    return table.to_pandas()
+
+
+def _cached_read(path: str, reader: Callable[..., pd.DataFrame], **kwargs: Any) -> pd.DataFrame:
+    """
+    Read a remote tabular file through a local Parquet cache.
+
+    The cache key is derived from the path, reader and reader kwargs, so repeated
+    experiment runs skip the download and CSV parsing. Local paths are read directly.
+    """
+    import pandas as pd
+
+    if "://" not in path:
+        return reader(path, **kwargs)
+
+    key_source = f"{path}|{getattr(reader, '__name__', repr(reader))}|{sorted(kwargs.items())!r}"
+    cache_path = _DATASET_CACHE_DIR / f"{hashlib.sha1(key_source.encode()).hexdigest()}.parquet"
+
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            # Corrupt or partial cache entry - fall through and re-read the source
+            pass
+
+    df = reader(path, **kwargs)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp_path, compression="zstd", index=False)
+        tmp_path.replace(cache_path)
+    except Exception:
+        # Caching is best-effort; an unwritable cache dir or unserializable frame is not fatal
+        pass
+    return df
+
+
+def _make_example(payload: Dict[str, Any]) -> dspy.Example:
+    """Create a `dspy.Example` with `goal` as its only input field."""
+    import dspy
+
+    return dspy.Example(payload).with_inputs("goal")
+
+
+def _build_examples_from_df(
+    df: pd.DataFrame,
+    text_col: Optional[str],
+    ans_col: Optional[str],
+) -> List[dspy.Example]:
+    """
+    Build DSPy examples from a DataFrame using whole-column extraction.
+
+    Falls back to the stringified row dict as the goal when `text_col` is missing,
+    and omits the answer for rows where `ans_col` is missing or NaN.
+    """
+    if text_col and text_col in df.columns:
+        texts = df[text_col].astype(str).to_numpy()
+    else:
+        texts = [str(record) for record in df.to_dict(orient="records")]
+
+    if ans_col and ans_col in df.columns:
+        # NA mask and string conversion are computed once per column, not per row
+        has_answer = df[ans_col].notna().to_numpy()
+        answers = df[ans_col].astype(str).to_numpy()
+        answers = [a if present else None for a, present in zip(answers, has_answer)]
+    else:
+        answers = [None] * len(df)
+
+    return [
+        _make_example({"goal": t} if a is None else {"goal": t, "answer": a})
+        for t, a in zip(texts, answers)
+    ]
+
+
+_FRAMES_TEXT_CANDIDATES = ("prompt", "question", "input", "instruction", "goal", "query", "text")
+_FRAMES_ANSWER_CANDIDATES = ("answer", "target", "label", "output", "response", "gold")
+
+
+def _load_tabular_dataset(
+    path: str,
+    reader: Callable[..., pd.DataFrame] = _read_csv_arrow,
+    reader_kwargs: Optional[Dict[str, Any]] = None,
+    text_candidates: Sequence[str] = ("problem", "question", "prompt"),
+    answer_candidates: Sequence[str] = ("answer", "target", "label"),
+    text_column: Optional[str] = None,
+    answer_column: Optional[str] = None,
+    train_size: int = 5,
+    val_size: int = 5,
+    test_size: int = 15,
+    seed: int = 0,
+    no_split: bool = False,
+) -> Union[Tuple[List[dspy.Example], List[dspy.Example], List[dspy.Example]], List[dspy.Example]]:
+    """
+    Shared loader for single-file tabular datasets (CSV/TSV/Parquet).
+
+    Reads `path` with `reader`, resolves the text/answer columns case-insensitively
+    (explicit `text_column`/`answer_column` take precedence over the candidate lists),
+    shuffles deterministically and splits sequentially into train/val/test.
+    """
+    df = _cached_read(path, reader, **(reader_kwargs or {}))
+
+    if df.empty:
+        return [], [], []
+
+    # Case-insensitive column resolver
+    lower_to_orig = {c.lower(): c for c in df.columns}
+
+    def pick(col_candidates: Sequence[str], explicit: Optional[str]) -> Optional[str]:
+        if explicit:
+            # Use explicit if present
+            return lower_to_orig.get(explicit.lower(), explicit.lower())
+        for c in col_candidates:
+            if c in lower_to_orig:
+                return lower_to_orig[c]
+        return None
+
+    text_col = pick(text_candidates, text_column)
+    ans_col = pick(answer_candidates, answer_column)
+
+    rng = random.Random(seed)
+
+    # Small splits of a large table: sample distinct rows and only build those examples
+    needed = train_size + val_size + test_size
+    if not no_split and needed < len(df) // 4:
+        idx = rng.sample(range(len(df)), needed)
+        sampled = _build_examples_from_df(df.iloc[idx], text_col, ans_col)
+        val_end = train_size + val_size
+        return sampled[:train_size], sampled[train_size:val_end], sampled[val_end:]
+
+    # Build DSPy examples
+    examples = _build_examples_from_df(df, text_col, ans_col)
+
+    # Deterministic shuffle
+    rng.shuffle(examples)
+
+    # Return full dataset if no_split is True
+    if no_split:
+        return examples
+
+    # Helper to take n items, repeating if needed
+    def take(exs: List[dspy.Example], n: int) -> List[dspy.Example]:
+        if n <= len(exs):
+            return exs[:n]
+        return list(islice(cycle(exs), n))
+
+    # Split sequentially from the shuffled list
+    train_set = take(examples, train_size)
+    remain = examples[len(train_set):]
+    val_set = take(remain, val_size)
+    remain = remain[len(val_set):]
+    # If not enough left, fill from start to keep sizes
+    test_set = take(remain if remain else examples, test_size)
 
+    return train_set, val_set, test_set
+
+
+@_memoize_dataset()
 def load_aimo_datasets(
     train_size: int = 5,
     val_size: int = 5,
@@ -27,46 +249,49 @@ def load_aimo_datasets(
         If no_split=True: List of all examples
         If no_split=False: Tuple of (train_set, val_set, test_set)
     """
+    from datasets import load_dataset
+
+    # Load training/validation split from AIMO, shuffled on the Arrow side with a fixed seed
+    train_ds = load_dataset("AI-MO/aimo-validation-aime", split="train").shuffle(seed=seed)
+    tot_num = len(train_ds)
 
-    # Load training/validation split from AIMO
-    train_split = load_dataset("AI-MO/aimo-validation-aime")['train']
-    train_split = [
-        dspy.Example({
+    def to_train_example(x):
+        return _make_example({
             "goal": x['problem'],
             'solution': x['solution'],
             'answer': x['answer'],
-        }).with_inputs("goal")
-        for x in train_split
-    ]
-
-    # Shuffle with fixed seed
-    random.Random(seed).shuffle(train_split)
-    tot_num = len(train_split)
+        })
 
     # Load test split from AIME 2025
     test_split = load_dataset("MathArena/aime_2025")['train']
     test_split = [
-        dspy.Example({
+        _make_example({
             "goal": x['problem'],
             'answer': x['answer'],
-        }).with_inputs("goal")
+        })
         for x in test_split
     ]
 
     # Return full dataset if no_split is True
     if no_split:
-        return train_split + test_split
+        return [to_train_example(x) for x in train_ds] + test_split
 
-    # Split datasets
-    train_set = train_split[:train_size]
-    val_set = train_split[tot_num // 2:tot_num // 2 + val_size]
+    # Split indices, then decode only the selected rows
+    train_idx = range(min(train_size, tot_num))
+    val_idx = range(tot_num // 2, min(tot_num // 2 + val_size, tot_num))
+    needed = sorted(set(train_idx) | set(val_idx))
+    by_index = dict(zip(needed, (to_train_example(x) for x in train_ds.select(needed))))
+
+    train_set = [by_index[i] for i in train_idx]
+    val_set = [by_index[i] for i in val_idx]
 
     # Repeat test set if needed to reach desired size
-    test_set = (test_split * ((test_size // len(test_split)) + 1))[:test_size]
+    test_set = list(islice(cycle(test_split), test_size))
 
     return train_set, val_set, test_set
 
 
+@_memoize_dataset()
 def load_abgen_dataset(
     train_size: int = 5,
     val_size: int = 5,
@@ -88,46 +313,69 @@ def load_abgen_dataset(
         If no_split=True: List of all examples
         If no_split=False: Tuple of (train_set, val_set, test_set)
     """
-    # Helper function to prepare user prompt for the ABGen dataset
-    def prepare_goal(example):
-        research_background = f"Research Background:\n{example['research_background']}\n"
-        method = f"Method Section:\n{example['method']}\n"
-        main_experiment = f"Main Experiment Setup\n{example['main_experiment']['experiment_setup']}\n\n Main Experiment Results\n{example['main_experiment']['results']}\n"
-
-        ablation_module = example["ablation_study"]["module_name"]
-
-        return f"Research Context:\n{research_background}{method}{main_experiment}\n\n Design an ablation study about {ablation_module} based on the research context above."
-
-    # Load dataset ONCE to ensure deterministic ordering
-    raw_dataset = load_dataset("yale-nlp/AbGen")['human_evaluation']
-    
-    # Convert to list immediately to lock in the ordering
-    raw_list = list(raw_dataset)
-    
-    # Build examples with deterministic ordering (preserve original dataset order)
-    all_examples = [
-        dspy.Example({
-            "goal": prepare_goal(x),
-            'solution': x['ablation_study']['experiment_setup'],
-            'answer': x['ablation_study']['research_objective'],
-        }).with_inputs("goal")
-        for x in raw_list
-    ]
+    import pandas as pd
+    from datasets import load_dataset
 
-    tot_num = len(all_examples)
+    # Helper to build examples for the ABGen dataset from the selected rows
+    def build_examples(dataset) -> List[dspy.Example]:
+        df = dataset.to_pandas()
+        if df.empty:
+            return []
+        main_exp = pd.json_normalize(df["main_experiment"].tolist())
+        ablation = pd.json_normalize(df["ablation_study"].tolist())
+
+        # One f-string per row (single allocation) over the extracted column arrays
+        goals = [
+            f"Research Context:\nResearch Background:\n{background}\nMethod Section:\n{method}\n"
+            f"Main Experiment Setup\n{setup}\n\n Main Experiment Results\n{results}\n\n\n"
+            f" Design an ablation study about {module} based on the research context above."
+            for background, method, setup, results, module in zip(
+                df["research_background"].to_numpy(),
+                df["method"].to_numpy(),
+                main_exp["experiment_setup"].to_numpy(),
+                main_exp["results"].to_numpy(),
+                ablation["module_name"].to_numpy(),
+            )
+        ]
+
+        return [
+            _make_example({
+                "goal": goal,
+                'solution': solution,
+                'answer': answer,
+            })
+            for goal, solution, answer in zip(
+                goals,
+                ablation["experiment_setup"].to_numpy(),
+                ablation["research_objective"].to_numpy(),
+            )
+        ]
+
+    # Load only the split we need; row order of the Arrow-backed Dataset is deterministic
+    raw_dataset = load_dataset("yale-nlp/AbGen", split="human_evaluation")
+    tot_num = len(raw_dataset)
 
     # Return full dataset if no_split is True (deterministic order)
     if no_split:
-        return all_examples
+        return build_examples(raw_dataset)
+
+    # Split indices (no shuffling - preserves original order)
+    train_idx = range(min(train_size, tot_num))
+    val_idx = range(tot_num // 2, min(tot_num // 2 + val_size, tot_num))
+    test_idx = range(min(test_size, tot_num))  # Use first test_size items for test
+
+    # Decode only the rows that end up in a split
+    needed = sorted(set(train_idx) | set(val_idx) | set(test_idx))
+    by_index = dict(zip(needed, build_examples(raw_dataset.select(needed))))
 
-    # Split datasets (no shuffling - preserves original order)
-    train_set = all_examples[:train_size]
-    val_set = all_examples[tot_num // 2:tot_num // 2 + val_size]
-    test_set = all_examples[:test_size]  # Use first test_size items for test
+    train_set = [by_index[i] for i in train_idx]
+    val_set = [by_index[i] for i in val_idx]
+    test_set = [by_index[i] for i in test_idx]
 
     return train_set, val_set, test_set
 
 
+@_memoize_dataset()
 def load_frames_dataset(
     train_size: int = 5,
     val_size: int = 5,
@@ -160,69 +408,22 @@ def load_frames_dataset(
         If no_split=True: List of all examples
         If no_split=False: Tuple of (train_set, val_set, test_set)
     """
-    # Read TSV
-    df = pd.read_csv(tsv_path, sep=sep)
-
-    if df.empty:
-        return [], [], []
-
-    # Case-insensitive column resolver
-    lower_to_orig = {c.lower(): c for c in df.columns}
-
-    def pick(col_candidates, explicit_lower: Optional[str]):
-        if explicit_lower:
-            # Use explicit if present
-            return lower_to_orig.get(explicit_lower, explicit_lower)
-        for c in col_candidates:
-            if c in lower_to_orig:
-                return lower_to_orig[c]
-        return None
-
-    text_col = pick(
-        ["prompt", "question", "input", "instruction", "goal", "query", "text"],
-        text_column.lower() if text_column else None,
-    )
-    ans_col = pick(
-        ["answer", "target", "label", "output", "response", "gold"],
-        answer_column.lower() if answer_column else None,
+    return _load_tabular_dataset(
+        tsv_path,
+        reader_kwargs={"sep": sep},
+        text_candidates=_FRAMES_TEXT_CANDIDATES,
+        answer_candidates=_FRAMES_ANSWER_CANDIDATES,
+        text_column=text_column,
+        answer_column=answer_column,
+        train_size=train_size,
+        val_size=val_size,
+        test_size=test_size,
+        seed=seed,
+        no_split=no_split,
     )
 
-    # Build DSPy examples
-    examples: List[dspy.Example] = []
-    for _, row in df.iterrows():
-        goal_text = str(row[text_col]) if text_col and text_col in row else str(row.to_dict())
-        payload = {"goal": goal_text}
-        if ans_col and ans_col in row and not pd.isna(row[ans_col]):
-            payload["answer"] = str(row[ans_col])
-        examples.append(dspy.Example(payload).with_inputs("goal"))
-
-    # Deterministic shuffle
-    rng = random.Random(seed)
-    rng.shuffle(examples)
-
-    # Return full dataset if no_split is True
-    if no_split:
-        return examples
-
-    # Helper to take n items, repeating if needed
-    def take(exs: List[dspy.Example], n: int) -> List[dspy.Example]:
-        if n <= len(exs):
-            return exs[:n]
-        if not exs:
-            return []
-        reps = (n + len(exs) - 1) // len(exs)
-        return (exs * reps)[:n]
-
-    # Split sequentially from the shuffled list
-    train_set = take(examples, train_size)
-    remain = examples[len(train_set):]
-    val_set = take(remain, val_size)
-    remain = remain[len(val_set):]
-    # If not enough left, fill from start to keep sizes
-    test_set = take(remain if remain else examples, test_size)
-
-    return train_set, val_set, test_set
 
+@_memoize_dataset()
 def load_simpleqa_dataset(
     train_size: int = 5,
     val_size: int = 5,
@@ -246,51 +447,19 @@ def load_simpleqa_dataset(
         If no_split=True: List of all examples
         If no_split=False: Tuple of (train_set, val_set, test_set)
     """
-    df = pd.read_csv(csv_path)
-
-    if df.empty:
-        return [], [], []
-
-    # Resolve columns case-insensitively
-    lower_to_orig = {c.lower(): c for c in df.columns}
-    problem_col = lower_to_orig.get("problem", "problem")
-    answer_col = lower_to_orig.get("answer", "answer")
-
-    # Build DSPy examples
-    examples: List[dspy.Example] = []
-    for _, row in df.iterrows():
-        goal_text = str(row[problem_col]) if problem_col in row else str(row.to_dict())
-        payload = {"goal": goal_text}
-        if answer_col in row and not pd.isna(row[answer_col]):
-            payload["answer"] = str(row[answer_col])
-        examples.append(dspy.Example(payload).with_inputs("goal"))
-
-    # Deterministic shuffle
-    rng = random.Random(seed)
-    rng.shuffle(examples)
-
-    # Return full dataset if no_split is True
-    if no_split:
-        return examples
-
-    # Helper to take n items, repeating if needed
-    def take(exs: List[dspy.Example], n: int) -> List[dspy.Example]:
-        if n <= len(exs):
-            return exs[:n]
-        if not exs:
-            return []
-        reps = (n + len(exs) - 1) // len(exs)
-        return (exs * reps)[:n]
-
-    # Split sequentially from the shuffled list
-    train_set = take(examples, train_size)
-    remain = examples[len(train_set):]
-    val_set = take(remain, val_size)
-    remain = remain[len(val_set):]
-    test_set = take(remain if remain else examples, test_size)
+    return _load_tabular_dataset(
+        csv_path,
+        text_candidates=("problem",),
+        answer_candidates=("answer",),
+        train_size=train_size,
+        val_size=val_size,
+        test_size=test_size,
+        seed=seed,
+        no_split=no_split,
+    )
 
-    return train_set, val_set, test_set
 
+@_memoize_dataset()
 def load_simpleqa_verified_dataset(
     train_size: int = 5,
     val_size: int = 5,
@@ -316,51 +485,19 @@ def load_simpleqa_verified_dataset(
         If no_split=True: List of all examples
         If no_split=False: Tuple of (train_set, val_set, test_set)
     """
-    df = pd.read_csv(csv_path)
-
-    if df.empty:
-        return [], [], []
-
-    # Resolve columns case-insensitively
-    lower_to_orig = {c.lower(): c for c in df.columns}
-    problem_col = lower_to_orig.get("problem", "problem")
-    answer_col = lower_to_orig.get("answer", "answer")
-
-    # Build DSPy examples
-    examples: List[dspy.Example] = []
-    for _, row in df.iterrows():
-        goal_text = str(row[problem_col]) if problem_col in row else str(row.to_dict())
-        payload = {"goal": goal_text}
-        if answer_col in row and not pd.isna(row[answer_col]):
-            payload["answer"] = str(row[answer_col])
-        examples.append(dspy.Example(payload).with_inputs("goal"))
-
-    # Deterministic shuffle
-    rng = random.Random(seed)
-    rng.shuffle(examples)
-
-    # Return full dataset if no_split is True
-    if no_split:
-        return examples
-
-    # Helper to take n items, repeating if needed
-    def take(exs: List[dspy.Example], n: int) -> List[dspy.Example]:
-        if n <= len(exs):
-            return exs[:n]
-        if not exs:
-            return []
-        reps = (n + len(exs) - 1) // len(exs)
-        return (exs * reps)[:n]
-
-    # Split sequentially from the shuffled list
-    train_set = take(examples, train_size)
-    remain = examples[len(train_set):]
-    val_set = take(remain, val_size)
-    remain = remain[len(val_set):]
-    test_set = take(remain if remain else examples, test_size)
+    return _load_tabular_dataset(
+        csv_path,
+        text_candidates=("problem",),
+        answer_candidates=("answer",),
+        train_size=train_size,
+        val_size=val_size,
+        test_size=test_size,
+        seed=seed,
+        no_split=no_split,
+    )
 
-    return train_set, val_set, test_set
 
+@_memoize_dataset()
 def load_seal0_dataset(
     train_size: int = 5,
     val_size: int = 5,
@@ -386,47 +523,16 @@ def load_seal0_dataset(
         If no_split=True: List of all examples
         If no_split=False: Tuple of (train_set, val_set, test_set)
     """
-    df = pd.read_parquet(parquet_path)
-
-    if df.empty:
-        return [], [], []
-
-    # Resolve columns case-insensitively
-    lower_to_orig = {c.lower(): c for c in df.columns}
-    question_col = lower_to_orig.get("question", "question")
-    answer_col = lower_to_orig.get("answer", "answer")
-
-    # Build DSPy examples
-    examples: List[dspy.Example] = []
-    for _, row in df.iterrows():
-        goal_text = str(row[question_col]) if question_col in row else str(row.to_dict())
-        payload = {"goal": goal_text}
-        if answer_col in row and not pd.isna(row[answer_col]):
-            payload["answer"] = str(row[answer_col])
-        examples.append(dspy.Example(payload).with_inputs("goal"))
-
-    # Deterministic shuffle
-    rng = random.Random(seed)
-    rng.shuffle(examples)
-
-    # Return full dataset if no_split is True
-    if no_split:
-        return examples
-
-    # Helper to take n items, repeating if needed
-    def take(exs: List[dspy.Example], n: int) -> List[dspy.Example]:
-        if n <= len(exs):
-            return exs[:n]
-        if not exs:
-            return []
-        reps = (n + len(exs) - 1) // len(exs)
-        return (exs * reps)[:n]
-
-    # Split sequentially from the shuffled list
-    train_set = take(examples, train_size)
-    remain = examples[len(train_set):]
-    val_set = take(remain, val_size)
-    remain = remain[len(val_set):]
-    test_set = take(remain if remain else examples, test_size)
-
-    return train_set, val_set, test_set
\ No newline at end of file
+    import pandas as pd
+
+    return _load_tabular_dataset(
+        parquet_path,
+        reader=pd.read_parquet,
+        text_candidates=("question",),
+        answer_candidates=("answer",),
+        train_size=train_size,
+        val_size=val_size,
+        test_size=test_size,
+        seed=seed,
+        no_split=no_split,
+    )
@@ -3,24 +3,20 @@
 
 import argparse
 import asyncio
+import importlib
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
 
+import dspy
 from loguru import logger
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from prompt_optimization.compile_cache import compile_cache_key, load_compiled, save_compiled
 from prompt_optimization.config import load_config_from_yaml, get_default_config, save_config_to_yaml
-from prompt_optimization.dataset_loaders import (
-    load_aimo_datasets,
-    load_frames_dataset,
-    load_simpleqa_dataset,
-    load_simpleqa_verified_dataset,
-    load_seal0_dataset,
-)
 from prompt_optimization.judge import ComponentJudge
 from prompt_optimization.metrics import MetricWithFeedback, NumberMetric, SearchMetric
 from prompt_optimization.optimizer import create_optimizer
@@ -33,15 +29,22 @@ from roma_dspy.core.observability.span_manager import ROMASpanManager, set_span_
 from roma_dspy.config.schemas.observability import MLflowConfig
 
 
+# Loader names are resolved lazily so only the chosen dataset's loader is looked up
 DATASET_LOADERS = {
-    "aimo": load_aimo_datasets,
-    "frames": load_frames_dataset,
-    "simpleqa": load_simpleqa_dataset,
-    "simpleqa_verified": load_simpleqa_verified_dataset,
-    "seal0": load_seal0_dataset,
+    "aimo": "prompt_optimization.dataset_loaders:load_aimo_datasets",
+    "frames": "prompt_optimization.dataset_loaders:load_frames_dataset",
+    "simpleqa": "prompt_optimization.dataset_loaders:load_simpleqa_dataset",
+    "simpleqa_verified": "prompt_optimization.dataset_loaders:load_simpleqa_verified_dataset",
+    "seal0": "prompt_optimization.dataset_loaders:load_seal0_dataset",
 }
 
 
+def resolve_dataset_loader(dataset_type):
+    """Import and return the loader function registered for `dataset_type`."""
+    module_name, func_name = DATASET_LOADERS[dataset_type].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
 def parse_args():
     """Parse CLI arguments."""
     parser = argparse.ArgumentParser(
@@ -122,7 +125,27 @@ async def evaluate_test(module, test_set, max_parallel):
     return await executor.execute_batch(module, test_set, show_progress=True)
 
 
+def compile_in_run(optimizer, run_id, *args, **kwargs):
+    """
+    Run optimizer.compile() inside the experiment's MLflow run.
+
+    Call this on the thread that started the run. MLflow's active run and
+    dspy.settings are both per thread, so GEPA autolog and the execution manager's
+    dspy.configure only take effect there. The run is left active for the caller to end.
+    """
+    if run_id is not None:
+        import mlflow
+
+        active_run = mlflow.active_run()
+        if active_run is None or active_run.info.run_id != run_id:
+            raise RuntimeError(
+                f"MLflow run {run_id} is not active on this thread; compile on the thread that started it"
+            )
+    return optimizer.compile(*args, **kwargs)
+
+
 def main():
+    """CLI entry point."""
     args = parse_args()
 
     if args.verbose:
@@ -227,10 +250,13 @@ def main():
             "optimizer": "GEPA",
         })
 
+    # Metrics are collected here and sent to MLflow in a single batched call
+    run_metrics = {}
+
     try:
         # Load dataset
         logger.info("Loading dataset...")
-        dataset_loader = DATASET_LOADERS[dataset_type]
+        dataset_loader = resolve_dataset_loader(dataset_type)
         train, val, test = dataset_loader(
             train_size=config.train_size,
             val_size=config.val_size,
@@ -248,14 +274,23 @@ def main():
 
         # Create metric
         logger.info("Creating metric...")
-        judge = ComponentJudge(lm_config=config.judge_lm)
-        scoring_metric = SearchMetric(lm_config=config.judge_lm, prompt=SEARCH_GRADER_PROMPT)
+        # Build the judge LM once and share it between the judge, the scoring metric
+        # and (when configured identically) GEPA's reflection step
+        judge_lm = dspy.LM(
+            model=config.judge_lm.model,
+            temperature=config.judge_lm.temperature,
+            max_tokens=config.judge_lm.max_tokens,
+            cache=config.judge_lm.cache,
+        )
+        judge = ComponentJudge(lm=judge_lm)
+        scoring_metric = SearchMetric(lm=judge_lm, prompt=SEARCH_GRADER_PROMPT)
         metric = MetricWithFeedback(judge=judge, scoring_metric=scoring_metric)
         logger.info("✓ Metric created")
 
         # Create GEPA optimizer (MLflow autolog tracks automatically)
         logger.info("Creating GEPA optimizer...")
-        optimizer = create_optimizer(config, metric, run_name=run_name)
+        reflection_lm = judge_lm if config.reflection_lm == config.judge_lm else None
+        optimizer = create_optimizer(config, metric, run_name=run_name, reflection_lm=reflection_lm)
         logger.info("✓ Optimizer created")
 
         # Run optimization
@@ -265,43 +300,57 @@ def main():
         logger.info("=" * 80)
 
         start = datetime.now()
-        optimized = optimizer.compile(solver_module, trainset=train, valset=val)
+        optimized = None
+        cache_key = None
+        if config.compile_cache_dir:
+            cache_key = compile_cache_key(
+                solver_module, train, val, config,
+                profile=profile,
+                dataset=dataset_type,
+                metric=type(metric).__name__,
+                grader_prompt=SEARCH_GRADER_PROMPT,
+            )
+            optimized = load_compiled(solver_module, config.compile_cache_dir, cache_key)
+            if optimized is not None:
+                logger.info(f"✓ Reusing cached compile result {cache_key}")
+
+        if optimized is None:
+            mlflow_run_id = mlflow.active_run().info.run_id if mlflow_manager else None
+            optimized = compile_in_run(optimizer, mlflow_run_id, solver_module, trainset=train, valset=val)
+            if cache_key:
+                cache_path = save_compiled(optimized, config.compile_cache_dir, cache_key)
+                logger.info(f"✓ Cached compile result at {cache_path}")
         duration = (datetime.now() - start).total_seconds()
 
         logger.info("=" * 80)
         logger.info(f"✓ Optimization complete ({duration:.1f}s)")
         logger.info("=" * 80)
 
-        if mlflow_manager:
-            mlflow.log_metrics({"optimization_time_seconds": duration})
+        run_metrics["optimization_time_seconds"] = duration
 
         # Note: GEPA autolog automatically logs "metric progression over time" as step-wise metrics
         # No need to manually log detailed_results - autolog handles it!
 
         # Evaluate on test set
         logger.info("Evaluating on test set...")
+        # Compile runs with no event loop on this thread because the solver calls
+        # asyncio.run itself; this is the only loop the CLI starts
         test_results = asyncio.run(evaluate_test(optimized, test, config.max_parallel))
 
         # Calculate accuracy (use NumberMetric for now as fallback)
-        scores = []
-        for _, pred in zip(test, test_results):
-            if hasattr(pred, 'result_text') and pred.result_text:
-                scores.append(1)
-            else:
-                scores.append(0)
-
-        accuracy = sum(scores) / len(scores) if scores else 0
+        correct = sum(1 for pred in test_results if getattr(pred, 'result_text', None))
+        total = len(test_results)
+        accuracy = correct / total if total else 0
 
         logger.info("=" * 80)
-        logger.info(f"Test Accuracy: {accuracy:.2%} ({sum(scores)}/{len(scores)})")
+        logger.info(f"Test Accuracy: {accuracy:.2%} ({correct}/{total})")
         logger.info("=" * 80)
 
-        if mlflow_manager:
-            mlflow.log_metrics({
-                "test_accuracy": accuracy,
-                "test_correct": float(sum(scores)),
-                "test_total": float(len(scores)),
-            })
+        run_metrics.update({
+            "test_accuracy": accuracy,
+            "test_correct": float(correct),
+            "test_total": float(total),
+        })
 
         # Save optimized program
         output_dir = Path(config.output_path or "outputs") / exp_name
@@ -318,6 +367,12 @@ def main():
         # End MLflow run (must be in finally to ensure cleanup even on errors)
         if mlflow_manager:
             import mlflow
+            # Flush whatever was collected, even if a later step failed
+            if run_metrics:
+                try:
+                    mlflow.log_metrics(run_metrics)
+                except Exception as e:
+                    logger.warning(f"Failed to log metrics to MLflow: {e}")
             mlflow.end_run()
             logger.info(f"✓ MLflow run ended: {exp_name}")
 
@@ -1,5 +1,7 @@
 """LLM judge for evaluating component performance."""
 
+from typing import Optional
+
 import dspy
 from prompt_optimization.config import LMConfig
 from prompt_optimization.prompts import GRADER_PROMPT
@@ -23,15 +25,22 @@ class ComponentJudge:
     component performance within the recursive solver system.
     """
 
-    def __init__(self, *, prompt: str = GRADER_PROMPT, lm_config: LMConfig = judge_config):
+    def __init__(
+        self,
+        *,
+        prompt: str = GRADER_PROMPT,
+        lm_config: LMConfig = judge_config,
+        lm: Optional[dspy.LM] = None
+    ):
         """
         Initialize component judge.
 
         Args:
             prompt: Prompt for the judge
             lm_config: Language model configuration for the judge
+            lm: Pre-built LM to share with other components (overrides lm_config)
         """
-        self.lm = dspy.LM(
+        self.lm = lm if lm is not None else dspy.LM(
             model=lm_config.model,
             temperature=lm_config.temperature,
             max_tokens=lm_config.max_tokens,
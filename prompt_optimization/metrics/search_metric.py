@@ -1,3 +1,5 @@
+from typing import Optional
+
 import dspy
 
 from prompt_optimization.config import LMConfig
@@ -21,10 +23,18 @@ class SearchMetric(dspy.Module):
     Uses a classification prompt to judge semantic correctness rather than exact match.
     """
 
-    def __init__(self, lm_config: LMConfig, prompt: str = SEARCH_GRADER_PROMPT):
+    def __init__(
+        self,
+        lm_config: Optional[LMConfig] = None,
+        prompt: str = SEARCH_GRADER_PROMPT,
+        lm: Optional[dspy.LM] = None,
+    ):
         super().__init__()
+        if lm is None and lm_config is None:
+            raise ValueError("SearchMetric requires either lm_config or lm")
         self.prompt = prompt
-        self.lm = dspy.LM(
+        # A shared LM (e.g. the judge's) avoids duplicate clients and lets their caches hit
+        self.lm = lm if lm is not None else dspy.LM(
             model=lm_config.model,
             temperature=lm_config.temperature,
             max_tokens=lm_config.max_tokens,
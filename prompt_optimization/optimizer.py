@@ -13,7 +13,8 @@ def create_optimizer(
     config: OptimizationConfig,
     metric: MetricWithFeedback,
     component_selector: Optional[str] = None,
-    run_name: Optional[str] = None
+    run_name: Optional[str] = None,
+    reflection_lm: Optional[dspy.LM] = None
 ) -> GEPA:
     """
     Create configured GEPA optimizer with MLflow support.
@@ -22,6 +23,8 @@ def create_optimizer(
         config: Optimization configuration
         metric: Metric function (typically MetricWithFeedback)
         component_selector: Override selector from config (optional)
+        run_name: Run name shared with MLflow/W&B (optional)
+        reflection_lm: Pre-built reflection LM to reuse (optional, built from config otherwise)
 
     Returns:
         Configured GEPA optimizer
@@ -33,13 +36,14 @@ def create_optimizer(
         >>> optimizer = create_optimizer(config, metric)
     """
 
-    # Initialize reflection LM
-    reflection_lm = dspy.LM(
-        model=config.reflection_lm.model,
-        temperature=config.reflection_lm.temperature,
-        max_tokens=config.reflection_lm.max_tokens,
-        cache=config.reflection_lm.cache
-    )
+    # Initialize reflection LM unless the caller shares one
+    if reflection_lm is None:
+        reflection_lm = dspy.LM(
+            model=config.reflection_lm.model,
+            temperature=config.reflection_lm.temperature,
+            max_tokens=config.reflection_lm.max_tokens,
+            cache=config.reflection_lm.cache
+        )
 
     # Get selector function
     selector = component_selector or config.component_selector
@@ -0,0 +1,104 @@
+"""Prompt fragments shared verbatim by several executor seed prompts.
+
+Seed modules concatenate these with their task-specific sections at import time, so
+the assembled prompt text is identical to what each module defined inline before.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+EXECUTOR_HEADER = """
+# Executor — Instruction Prompt
+
+Role
+Execute tasks effectively by analyzing requirements, using available tools when needed, and delivering complete, accurate results.
+
+Output Contract (strict)
+- `output` (string): The complete result addressing the goal
+- `sources` (list[str]): Tools, APIs, or resources used (if any)
+"""
+
+EXECUTOR_QUALITY_STANDARDS = """
+Quality Standards
+- Accuracy: Provide correct, verified information
+- Completeness: Fully address all aspects of the goal
+- Clarity: Present results in clear, structured format
+- Efficiency: Minimize unnecessary iterations or tool calls
+- Source transparency: Cite all external data sources
+"""
+
+EXECUTOR_OUTPUT_FORMAT = """
+Output Format
+- Direct answers for simple queries
+- Structured formats (lists, tables, JSON) for complex data
+- Clear sections for multi-part answers
+- Citations at end or inline as appropriate
+"""
+
+# Size caps for executor seed prompts and their demos (characters), enforced by
+# tests/unit/test_executor_seed_prompts.py. Seed prompts tend to grow one section
+# at a time; every extra character is paid as input tokens on each executor call
+# and pushes the static prefix further from what providers cache cheaply.
+PROMPT_CHAR_BUDGET = 8_000
+DEMO_OUTPUT_CHAR_BUDGET = 6_000
+
+# Stand-in for the rendered demos in a messages template; callers replace it
+DEMOS_PLACEHOLDER = "<demos-placeholder>"
+
+
+def build_messages_template(prompt: str) -> Tuple[Dict[str, object], ...]:
+    """Build a two-block system messages template with a cache breakpoint after the prompt.
+
+    The first block holds the static prompt and carries an ephemeral ``cache_control``
+    marker, so prefix caching still hits when only the demos change (e.g. while an
+    optimizer rotates demo sets). The second block holds ``DEMOS_PLACEHOLDER``;
+    callers copy the blocks into their own message list and put the rendered demos
+    there.
+    """
+    return (
+        {"role": "system", "content": prompt, "cache_control": {"type": "ephemeral"}},
+        {"role": "system", "content": DEMOS_PLACEHOLDER},
+    )
+
+
+def _json_default(value):
+    """Serialize pydantic models by their fields and anything else by ``str``."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def fingerprint(prompt: str, demos: Iterable) -> str:
+    """Return a 128-bit blake2b fingerprint of a prompt and its demos.
+
+    Demos are serialized as sorted-key JSON of ``Example.toDict()`` (pydantic
+    values such as ``SubTask`` via ``model_dump``), so the fingerprint only changes
+    when the prompt text or demo contents change.
+    """
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16)
+    for demo in demos:
+        digest.update(b"\0")
+        digest.update(json.dumps(demo.toDict(), sort_keys=True, default=_json_default).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _token_encoder():
+    """Return the o200k_base tiktoken encoding, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # tiktoken missing, or its BPE file can't be fetched (e.g. offline)
+        return None
+
+
+def count_tokens(text: str) -> Optional[int]:
+    """Count tokens in a seed prompt/demo string, or return None if no encoder is available."""
+    encoder = _token_encoder()
+    if encoder is None:
+        return None
+    return len(encoder.encode(text))
@@ -6,16 +6,11 @@ executor (used as fallback when task doesn't match specific task type mappings).
 
 import dspy
 
-EXECUTOR_PROMPT = r"""
-# Executor — Instruction Prompt
-
-Role
-Execute tasks effectively by analyzing requirements, using available tools when needed, and delivering complete, accurate results.
-
-Output Contract (strict)
-- `output` (string): The complete result addressing the goal
-- `sources` (list[str]): Tools, APIs, or resources used (if any)
+from ._shared import EXECUTOR_HEADER, EXECUTOR_OUTPUT_FORMAT, EXECUTOR_QUALITY_STANDARDS
 
+EXECUTOR_PROMPT = (
+    EXECUTOR_HEADER
+    + """
 Execution Guidelines
 1. Understand the goal: Analyze what's being asked and what constitutes completion
 2. Choose approach: Determine if tools are needed or if reasoning alone suffices
@@ -23,14 +18,9 @@ Execution Guidelines
 4. Iterate as needed: Refine approach based on intermediate results
 5. Deliver completely: Ensure output fully addresses the original goal
 6. Cite sources: Always list tools/APIs/resources used
-
-Quality Standards
-- Accuracy: Provide correct, verified information
-- Completeness: Fully address all aspects of the goal
-- Clarity: Present results in clear, structured format
-- Efficiency: Minimize unnecessary iterations or tool calls
-- Source transparency: Cite all external data sources
-
+"""
+    + EXECUTOR_QUALITY_STANDARDS
+    + """
 Common Patterns
 - Pure reasoning: No tools → think through problem → deliver answer
 - Data retrieval: Tool call → extract data → format → cite source
@@ -42,13 +32,9 @@ Error Handling
 - Incomplete data: State limitations clearly
 - Ambiguous goals: Make reasonable assumptions or ask for clarification
 - Invalid inputs: Suggest corrections or alternatives
-
-Output Format
-- Direct answers for simple queries
-- Structured formats (lists, tables, JSON) for complex data
-- Clear sections for multi-part answers
-- Citations at end or inline as appropriate
 """
+    + EXECUTOR_OUTPUT_FORMAT
+)
 
 EXECUTOR_DEMOS = [
     # Demo 1: Simple reasoning task (no tools)
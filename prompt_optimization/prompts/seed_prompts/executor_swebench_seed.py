@@ -12,10 +12,14 @@ Key principles:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import dspy
 
+from ._shared import build_messages_template, count_tokens, fingerprint
+
 
-EXECUTOR_SWEBENCH_PROMPT = r"""
+EXECUTOR_SWEBENCH_PROMPT = """
 # Executor — SWE-Bench Bug Fix Execution
 
 Role
@@ -33,6 +37,7 @@ Output Contract (strict)
 
 Available Tools
 - `read_file(path)`: Read file contents from the repository
+- `read_files(paths)`: Read several files in one call (list of paths)
 - `save_file(path, content)`: Write/update a file
 - `execute_command(cmd)`: Run shell commands (for exploration, not fixes)
 
@@ -42,6 +47,7 @@ CRITICAL Execution Rules
    - ALWAYS read the target file before modifying it
    - Understand the existing code structure
    - Identify the exact location of the bug
+   - Prefer a single `read_files` call with multiple paths over sequential reads when the target module is not yet known
 
 2. **Minimal Changes Only**
    - Change only what's necessary to fix the bug
@@ -67,43 +73,7 @@ CRITICAL Execution Rules
    - Don't add type hints if file doesn't use them
 
 Common Bug Fix Patterns
-
-**Return Value Fix:**
-```python
-# Bug: Returns {} instead of None
-return args, env  # Wrong
-
-# Fix: Convert empty to None
-return args, env or None  # Correct
-```
-
-**Missing Import Fix:**
-```python
-# Add import to existing import block
-from django.core.exceptions import PermissionDenied
-```
-
-**Condition Fix:**
-```python
-# Bug: Wrong condition
-if env:  # Empty dict is falsy
-
-# Fix: Explicit None check
-if env is not None:  # Empty dict is truthy
-```
-
-**Method Override Fix:**
-```python
-# Bug: Method doesn't handle edge case
-def exists(self):
-    if self.query.is_sliced:
-        raise AssertionError("...")  # Wrong
-
-# Fix: Handle the case properly
-def exists(self):
-    if self.query.is_sliced:
-        return bool(self[:1])  # Correct
-```
+- See demos for concrete fix patterns.
 
 Execution Steps
 1. Read the file containing the bug
@@ -218,10 +188,29 @@ def get_swebench_executor_config():
     """Return configuration for SWE-bench executor.
 
     Returns:
-        dict: Configuration dict with prompt and demos
+        dict: Configuration with prompt and demos. The values are built once and
+        shared; each call returns a new dict. ``demos`` is an immutable tuple
+        snapshot of the module-level list (which stays a list because DemoLoader
+        requires one). The prompt is static, so it is flagged ``cacheable`` and
+        ``messages_template`` puts the cache breakpoint between the prompt and the
+        demos (see ``build_messages_template``). ``prompt_tokens``/``demo_tokens``
+        hold o200k_base token counts (None when tiktoken is unavailable).
+        ``fingerprint`` identifies prompt plus demos, for use in cache keys.
     """
+    return dict(_build_swebench_executor_config())
+
+
+@lru_cache(maxsize=1)
+def _build_swebench_executor_config():
+    """Build the SWE-bench executor config."""
     return {
         "prompt": EXECUTOR_SWEBENCH_PROMPT,
-        "demos": EXECUTOR_SWEBENCH_DEMOS,
+        "cacheable": True,
+        "messages_template": build_messages_template(EXECUTOR_SWEBENCH_PROMPT),
+        "demos": tuple(EXECUTOR_SWEBENCH_DEMOS),
+        "fingerprint": fingerprint(EXECUTOR_SWEBENCH_PROMPT, EXECUTOR_SWEBENCH_DEMOS),
+        # Token counts are computed once here (not at import) since tiktoken may fetch its BPE file
+        "prompt_tokens": count_tokens(EXECUTOR_SWEBENCH_PROMPT),
+        "demo_tokens": tuple(count_tokens(f"{demo.goal}\n{demo.output}") for demo in EXECUTOR_SWEBENCH_DEMOS),
         "description": "Executor optimized for SWE-bench bug fix tasks"
     }
@@ -6,18 +6,39 @@ for multimedia analysis tasks.
 Based on executor_seed.py with additions for vision/multimodal capabilities.
 """
 
+from functools import lru_cache
+
 import dspy
 
-EXECUTOR_TB2_PROMPT = r"""
-# Executor — Instruction Prompt
+from ._shared import (
+    EXECUTOR_HEADER,
+    EXECUTOR_OUTPUT_FORMAT,
+    EXECUTOR_QUALITY_STANDARDS,
+    build_messages_template,
+    count_tokens,
+    fingerprint,
+)
 
-Role
-Execute tasks effectively by analyzing requirements, using available tools when needed, and delivering complete, accurate results.
+# Numbered execution steps, shared by the full and nano prompts. Step 4 differs:
+# the full prompt points at its API reference, which the nano prompt leaves out.
+_TB2_EXECUTION_GUIDELINES_TEMPLATE = """
+Execution Guidelines
+1. Understand the goal: Analyze what's being asked and what constitutes completion
+2. Choose approach: Determine if tools are needed or if reasoning alone suffices
+3. Use tools efficiently: Make targeted tool calls with clear purpose
+4. {vision_step}
+5. Iterate as needed: Refine approach based on intermediate results
+6. Deliver completely: Ensure output fully addresses the original goal
+7. Cite sources: Always list tools/APIs/resources used
+"""
 
-Output Contract (strict)
-- `output` (string): The complete result addressing the goal
-- `sources` (list[str]): Tools, APIs, or resources used (if any)
+_TB2_EXECUTION_GUIDELINES = _TB2_EXECUTION_GUIDELINES_TEMPLATE.format(
+    vision_step="Leverage vision APIs: For multimedia tasks, use GPT-5 models with multimodal input"
+)
 
+EXECUTOR_TB2_PROMPT = (
+    EXECUTOR_HEADER
+    + """
 Available LLM Provider APIs
 The following API keys are available as environment variables:
 
@@ -53,12 +74,6 @@ max_completion_tokens=20000  # ✓ CORRECT
 max_tokens=20000  # ✗ ERROR: "Unsupported parameter" with GPT-5
 ```
 
-**Responses API** - NOT supported (will error):
-- `temperature`: Only default value 1 allowed
-- `top_p`: Not supported
-- `presence_penalty`: Not supported
-- `frequency_penalty`: Not supported
-
 Example API call for GPT-5 multimodal (Responses API):
 ```python
 import base64
@@ -160,23 +175,10 @@ Multi-provider gateway for load balancing and cost optimization.
 Access to OpenAI, Google, Meta, Mistral models through unified API.
 
 Note: Anthropic and Fireworks APIs are not directly available.
-
-Execution Guidelines
-1. Understand the goal: Analyze what's being asked and what constitutes completion
-2. Choose approach: Determine if tools are needed or if reasoning alone suffices
-3. Use tools efficiently: Make targeted tool calls with clear purpose
-4. Leverage vision APIs: For multimedia tasks, use GPT-5 models with multimodal input
-5. Iterate as needed: Refine approach based on intermediate results
-6. Deliver completely: Ensure output fully addresses the original goal
-7. Cite sources: Always list tools/APIs/resources used
-
-Quality Standards
-- Accuracy: Provide correct, verified information
-- Completeness: Fully address all aspects of the goal
-- Clarity: Present results in clear, structured format
-- Efficiency: Minimize unnecessary iterations or tool calls
-- Source transparency: Cite all external data sources
-
+"""
+    + _TB2_EXECUTION_GUIDELINES
+    + EXECUTOR_QUALITY_STANDARDS
+    + """
 Common Patterns
 - Pure reasoning: No tools → think through problem → deliver answer
 - Data retrieval: Tool call → extract data → format → cite source
@@ -218,13 +220,21 @@ Error Handling
 - Incomplete data: State limitations clearly
 - Ambiguous goals: Make reasonable assumptions or ask for clarification
 - Invalid inputs: Suggest corrections or alternatives
-
-Output Format
-- Direct answers for simple queries
-- Structured formats (lists, tables, JSON) for complex data
-- Clear sections for multi-part answers
-- Citations at end or inline as appropriate
 """
+    + EXECUTOR_OUTPUT_FORMAT
+)
+
+# Distilled variant for gpt-5-nano-class executors: role, output contract and
+# execution steps only. It has no provider API reference, so the multimedia step
+# carries the one call detail that matters. Profiles with a nano executor reference
+# it as "prompt_optimization.prompts.seed_prompts.executor_tb2_seed:EXECUTOR_TB2_PROMPT_NANO".
+EXECUTOR_TB2_PROMPT_NANO = EXECUTOR_HEADER + _TB2_EXECUTION_GUIDELINES_TEMPLATE.format(
+    vision_step=(
+        "Multimedia tasks: Call the OpenAI Responses API (OPENAI_API_KEY) with image input "
+        "and `max_output_tokens`; never pass `max_tokens` to GPT-5 models"
+    )
+)
+
 
 EXECUTOR_TB2_DEMOS = [
     # Demo 1: Simple reasoning task (no tools)
@@ -373,14 +383,38 @@ EXECUTOR_TB2_DEMOS = [
 ]
 
 
-def get_tb2_executor_config():
+def get_tb2_executor_config(model: str = "gpt-5-mini"):
     """Return configuration for TB2 executor with GPT-5 multimodal support.
 
+    Args:
+        model: Executor model name. nano-class models (name contains ``nano``) get
+            ``EXECUTOR_TB2_PROMPT_NANO``; all others get the full prompt.
+
     Returns:
-        dict: Configuration dict with prompt and demos
+        dict: Configuration with prompt and demos. The values are built once per
+        prompt variant and shared; each call returns a new dict. ``demos`` is an
+        immutable tuple snapshot of the module-level list (which stays a list because
+        DemoLoader requires one). The prompt is static, so it is flagged ``cacheable``
+        and ``messages_template`` puts the cache breakpoint between the prompt and the
+        demos (see ``build_messages_template``). ``prompt_tokens``/``demo_tokens`` hold
+        o200k_base token counts (None when tiktoken is unavailable). ``fingerprint``
+        identifies prompt plus demos, for use in cache keys.
     """
+    return dict(_build_tb2_executor_config("nano" in model.lower()))
+
+
+@lru_cache(maxsize=2)
+def _build_tb2_executor_config(nano: bool):
+    """Build the TB2 executor config for the nano or full prompt variant."""
+    prompt = EXECUTOR_TB2_PROMPT_NANO if nano else EXECUTOR_TB2_PROMPT
     return {
-        "prompt": EXECUTOR_TB2_PROMPT,
-        "demos": EXECUTOR_TB2_DEMOS,
+        "prompt": prompt,
+        "cacheable": True,
+        "messages_template": build_messages_template(prompt),
+        "demos": tuple(EXECUTOR_TB2_DEMOS),
+        "fingerprint": fingerprint(prompt, EXECUTOR_TB2_DEMOS),
+        # Token counts are computed once here (not at import) since tiktoken may fetch its BPE file
+        "prompt_tokens": count_tokens(prompt),
+        "demo_tokens": tuple(count_tokens(f"{demo.goal}\n{demo.output}") for demo in EXECUTOR_TB2_DEMOS),
         "description": "Executor with GPT-5 multimodal API support for multimedia analysis"
     }
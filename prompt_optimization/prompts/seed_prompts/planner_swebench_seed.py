@@ -16,6 +16,8 @@ import dspy
 from roma_dspy.core.signatures.base_models.subtask import SubTask
 from roma_dspy.types.task_type import TaskType
 
+from ._shared import fingerprint
+
 
 PLANNER_SWEBENCH_PROMPT = r"""
 # Planner — SWE-Bench Bug Fix Planning
@@ -206,14 +208,19 @@ Repo: example/project""",
 ]
 
 
+# Identifies prompt + demos for optimizer cache keys (see prompt_optimization.compile_cache)
+_FINGERPRINT = fingerprint(PLANNER_SWEBENCH_PROMPT, PLANNER_SWEBENCH_DEMOS)
+
+
 def get_swebench_planner_config():
     """Return configuration for SWE-bench planner.
 
     Returns:
-        dict: Configuration dict with prompt and demos
+        dict: Configuration dict with prompt, demos and their fingerprint
     """
     return {
         "prompt": PLANNER_SWEBENCH_PROMPT,
         "demos": PLANNER_SWEBENCH_DEMOS,
+        "fingerprint": _FINGERPRINT,
         "description": "Planner optimized for SWE-bench bug fix tasks"
     }
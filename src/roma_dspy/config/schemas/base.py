@@ -2,7 +2,7 @@
 
 from pydantic.dataclasses import dataclass
 from pydantic import field_validator
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from loguru import logger
 import json
 
@@ -73,6 +73,10 @@ class LLMConfig:
     # See: https://openrouter.ai/docs for OpenRouter features (web search, routing, etc.)
     extra_body: Optional[Dict[str, Any]] = None
 
+    # Prompt caching for providers with explicit cache breakpoints (e.g. Anthropic),
+    # passed to LiteLLM as-is, e.g. [{"location": "message", "role": "system"}]
+    cache_control_injection_points: Optional[List[Dict[str, Any]]] = None
+
     @field_validator("extra_body")
     @classmethod
     def validate_extra_body(
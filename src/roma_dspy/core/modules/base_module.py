@@ -130,6 +130,10 @@ class BaseModule(dspy.Module):
             lm_kwargs["rollout_id"] = llm_config.rollout_id
         if llm_config.extra_body:
             lm_kwargs["extra_body"] = llm_config.extra_body
+        if llm_config.cache_control_injection_points:
+            lm_kwargs["cache_control_injection_points"] = (
+                llm_config.cache_control_injection_points
+            )
 
         # Create adapter from config
         adapter = llm_config.adapter_type.create_adapter(
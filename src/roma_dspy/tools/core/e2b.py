@@ -48,6 +48,11 @@ class E2BToolkit(BaseToolkit):
         (async with) for proper resource cleanup, or call aclose() explicitly.
     """
 
+    # Methods returning dicts instead of JSON strings (see _is_tool_available)
+    _STRUCTURED_RESULT_METHODS = frozenset(
+        {"run_python_code_dict", "run_command_dict", "get_sandbox_status_dict"}
+    )
+
     def _setup_dependencies(self) -> None:
         """Setup E2B toolkit dependencies."""
         try:
@@ -111,6 +116,11 @@ class E2BToolkit(BaseToolkit):
 
         self.log_debug(f"E2B toolkit initialized with timeout={self.timeout}s")
 
+    def _is_tool_available(self, tool_name: str) -> bool:
+        """Check if a tool should be available based on configuration."""
+        # Dict-returning variants are Python APIs, not agent tools
+        return tool_name not in self._STRUCTURED_RESULT_METHODS
+
     async def _ensure_sandbox_alive(self) -> object:
         """
         Ensure sandbox is alive and healthy, reinitialize if needed.
@@ -328,6 +338,15 @@ class E2BToolkit(BaseToolkit):
             run_python_code("import pandas as pd\\ndf = pd.DataFrame({'a': [1,2,3]})") - Use libraries
             run_python_code("print('Hello from sandbox!')") - Print output
         """
+        return json.dumps(await self.run_python_code_dict(code))
+
+    async def run_python_code_dict(self, code: str) -> dict:
+        """
+        Execute Python code in the E2B sandbox and return the result as a dict.
+
+        Same as run_python_code() but skips JSON serialization, for Python
+        callers that consume the result directly. Not exposed as an agent tool.
+        """
         sandbox = await self._ensure_sandbox_alive()
 
         try:
@@ -361,12 +380,12 @@ class E2BToolkit(BaseToolkit):
             }
 
             self.log_debug(f"Code executed successfully in sandbox {self._sandbox_id}")
-            return json.dumps(response)
+            return response
 
         except Exception as e:
             error_msg = f"Code execution failed: {str(e)}"
             self.log_error(error_msg)
-            return json.dumps({"success": False, "error": error_msg})
+            return {"success": False, "error": error_msg}
 
     async def run_command(self, command: str, timeout_seconds: int = 60) -> str:
         """
@@ -387,6 +406,15 @@ class E2BToolkit(BaseToolkit):
             run_command("ls -la /home") - List directory contents
             run_command("echo 'Hello World'") - Simple shell command
         """
+        return json.dumps(await self.run_command_dict(command, timeout_seconds))
+
+    async def run_command_dict(self, command: str, timeout_seconds: int = 60) -> dict:
+        """
+        Execute a shell command in the E2B sandbox and return the result as a dict.
+
+        Same as run_command() but skips JSON serialization, for Python callers
+        that consume the result directly. Not exposed as an agent tool.
+        """
         sandbox = await self._ensure_sandbox_alive()
 
         try:
@@ -402,12 +430,12 @@ class E2BToolkit(BaseToolkit):
             }
 
             self.log_debug(f"Command executed: {command} (exit={result.exit_code})")
-            return json.dumps(response)
+            return response
 
         except Exception as e:
             error_msg = f"Command execution failed: {str(e)}"
             self.log_error(error_msg)
-            return json.dumps({"success": False, "error": error_msg})
+            return {"success": False, "error": error_msg}
 
     async def get_sandbox_status(self) -> str:
         """
@@ -422,15 +450,22 @@ class E2BToolkit(BaseToolkit):
         Examples:
             get_sandbox_status() - Check current sandbox state
         """
+        return json.dumps(await self.get_sandbox_status_dict())
+
+    async def get_sandbox_status_dict(self) -> dict:
+        """
+        Get current sandbox status and information as a dict.
+
+        Same as get_sandbox_status() but skips JSON serialization, for Python
+        callers that consume the result directly. Not exposed as an agent tool.
+        """
         async with self._lock:
             if self._sandbox is None:
-                return json.dumps(
-                    {
-                        "success": True,
-                        "status": "no_sandbox",
-                        "message": "No sandbox created yet",
-                    }
-                )
+                return {
+                    "success": True,
+                    "status": "no_sandbox",
+                    "message": "No sandbox created yet",
+                }
 
             try:
                 is_running = await self._sandbox.is_running()
@@ -447,12 +482,12 @@ class E2BToolkit(BaseToolkit):
                     "template": self.template,
                 }
 
-                return json.dumps(response)
+                return response
 
             except Exception as e:
                 error_msg = f"Failed to get sandbox status: {str(e)}"
                 self.log_error(error_msg)
-                return json.dumps({"success": False, "error": error_msg})
+                return {"success": False, "error": error_msg}
 
     async def restart_sandbox(self) -> str:
         """
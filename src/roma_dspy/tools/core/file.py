@@ -4,7 +4,7 @@ import json
 import os
 import glob
 from pathlib import Path
-from typing import Set
+from typing import List, Set
 
 from roma_dspy.tools.base.base import BaseToolkit
 
@@ -60,6 +60,11 @@ class FileToolkit(BaseToolkit):
         self.max_file_size = self.config.get(
             "max_file_size", 10 * 1024 * 1024
         )  # 10MB default
+        # read_files caps, so one batched call can't pull a whole package into context
+        self.read_files_max_files = self.config.get("read_files_max_files", 20)
+        self.read_files_max_bytes = self.config.get(
+            "read_files_max_bytes", 256 * 1024
+        )  # 256KB default
 
     def _is_tool_available(self, tool_name: str) -> bool:
         """Check if a tool should be available based on configuration."""
@@ -252,6 +257,66 @@ class FileToolkit(BaseToolkit):
             self.log_error(error_msg)
             return json.dumps({"success": False, "error": error_msg})
 
+    def read_files(self, file_paths: List[str]) -> str:
+        """
+        Read several files in a single call.
+
+        Use this tool instead of repeated read_file calls when you need to inspect
+        multiple files, e.g. while locating which module contains a bug. Each file is
+        read with the same rules as read_file; a failure on one path does not stop
+        the others. At most read_files_max_files files and read_files_max_bytes bytes
+        of content are returned per call: the file that crosses the byte limit is cut
+        short and the remaining paths are listed under "skipped".
+
+        Args:
+            file_paths: Paths of the files to read (relative to base directory or absolute)
+
+        Returns:
+            JSON string with one read_file-style result per file read, in order, an
+            overall success flag that is true only if every returned file was read,
+            and a "truncated" flag (with "skipped" paths and a note when set)
+
+        Examples:
+            read_files(['setup.py', 'src/app/main.py']) - Read two files at once
+        """
+        results = []
+        remaining_bytes = self.read_files_max_bytes
+        truncated = False
+        for file_path in file_paths[: self.read_files_max_files]:
+            if remaining_bytes <= 0:
+                break
+            result = json.loads(self.read_file(file_path))
+            if result["success"]:
+                encoded = result["content"].encode("utf-8")
+                if len(encoded) > remaining_bytes:
+                    result["content"] = (
+                        encoded[:remaining_bytes].decode("utf-8", errors="ignore")
+                        + f"\n... [truncated: read_files byte limit of {self.read_files_max_bytes} reached]"
+                    )
+                    result["truncated"] = True
+                    truncated = True
+                remaining_bytes -= len(encoded)
+            results.append(result)
+
+        skipped = list(file_paths[len(results):])
+        response = {
+            "success": all(result["success"] for result in results),
+            "files": results,
+            "count": len(results),
+            "truncated": truncated or bool(skipped),
+        }
+        if response["truncated"]:
+            response["skipped"] = skipped
+            response["note"] = (
+                f"read_files returns at most {self.read_files_max_files} files and "
+                f"{self.read_files_max_bytes} bytes per call; read skipped or truncated "
+                "files separately if you still need them"
+            )
+            self.log_warning(
+                f"read_files truncated: returned {len(results)} of {len(file_paths)} files"
+            )
+        return json.dumps(response)
+
     def list_files(self, directory: str = ".") -> str:
         """
         List files and directories in the specified directory.
@@ -0,0 +1,83 @@
+"""Unit tests for the optimizer compile() disk cache."""
+
+import dspy
+
+from prompt_optimization.compile_cache import (
+    compile_cache_key,
+    load_compiled,
+    save_compiled,
+)
+from prompt_optimization.config import get_default_config
+
+
+class TinyProgram(dspy.Module):
+    """Minimal program with a single predictor."""
+
+    def __init__(self):
+        super().__init__()
+        self.answer = dspy.Predict("question -> answer")
+
+
+def _examples(*questions):
+    return [dspy.Example(question=q, answer="a").with_inputs("question") for q in questions]
+
+
+class TestCompileCacheKey:
+    """Test suite for compile_cache_key."""
+
+    def test_key_is_stable(self):
+        """Identical inputs produce the same key."""
+        config = get_default_config()
+        train, val = _examples("q1", "q2"), _examples("q3")
+
+        assert compile_cache_key(TinyProgram(), train, val, config, profile="test") == (
+            compile_cache_key(TinyProgram(), train, val, config, profile="test")
+        )
+
+    def test_key_changes_with_inputs(self):
+        """Data, seed instructions, compile settings and extras all change the key."""
+        config = get_default_config()
+        train, val = _examples("q1", "q2"), _examples("q3")
+        base = compile_cache_key(TinyProgram(), train, val, config)
+
+        assert base != compile_cache_key(TinyProgram(), _examples("q1"), val, config)
+        assert base != compile_cache_key(TinyProgram(), train, val, config, profile="other")
+
+        program = TinyProgram()
+        program.answer.signature = program.answer.signature.with_instructions("Be brief.")
+        assert base != compile_cache_key(program, train, val, config)
+
+        tuned = get_default_config()
+        tuned.max_metric_calls += 1
+        assert base != compile_cache_key(TinyProgram(), train, val, tuned)
+
+    def test_key_ignores_output_settings(self):
+        """Logging/output-only settings do not invalidate the cache."""
+        config = get_default_config()
+        train, val = _examples("q1"), _examples("q2")
+        base = compile_cache_key(TinyProgram(), train, val, config)
+
+        config.output_path = "elsewhere"
+        config.use_mlflow = not config.use_mlflow
+        assert base == compile_cache_key(TinyProgram(), train, val, config)
+
+
+class TestCompileCacheStorage:
+    """Test suite for saving and loading compile results."""
+
+    def test_round_trip(self, tmp_path):
+        """A saved compile result is restored into a fresh program."""
+        compiled = TinyProgram()
+        compiled.answer.signature = compiled.answer.signature.with_instructions("Optimized.")
+        compiled.answer.demos = _examples("demo")
+        save_compiled(compiled, str(tmp_path), "key")
+
+        restored = load_compiled(TinyProgram(), str(tmp_path), "key")
+
+        assert restored is not None
+        assert restored.answer.signature.instructions == "Optimized."
+        assert len(restored.answer.demos) == 1
+
+    def test_miss_returns_none(self, tmp_path):
+        """Unknown keys are cache misses."""
+        assert load_compiled(TinyProgram(), str(tmp_path), "missing") is None
@@ -0,0 +1,49 @@
+"""Unit tests for prompt_optimization.dataset_loaders helpers."""
+
+import pandas as pd
+
+from prompt_optimization.dataset_loaders import (
+    _build_examples_from_df,
+    _make_example,
+    _memoize_dataset,
+)
+
+
+def test_make_example_marks_goal_as_only_input():
+    """Loader examples pass `goal` to the program and keep everything else as labels."""
+    example = _make_example({"goal": "What is 2+2?", "answer": "4"})
+
+    assert dict(example.inputs()) == {"goal": "What is 2+2?"}
+    assert dict(example.labels()) == {"answer": "4"}
+    assert dict(example.copy().inputs()) == {"goal": "What is 2+2?"}
+
+
+def test_build_examples_from_df_omits_missing_answers():
+    """Rows without an answer become goal-only examples."""
+    df = pd.DataFrame({"question": ["q1", "q2"], "answer": ["a1", None]})
+
+    examples = _build_examples_from_df(df, "question", "answer")
+
+    assert [dict(e.inputs()) for e in examples] == [{"goal": "q1"}, {"goal": "q2"}]
+    assert [dict(e.labels()) for e in examples] == [{"answer": "a1"}, {}]
+
+
+def test_memoized_loader_returns_independent_examples():
+    """Mutating a loaded example or split does not leak into later loads."""
+    calls = []
+
+    @_memoize_dataset()
+    def load(size):
+        calls.append(size)
+        examples = [_make_example({"goal": f"q{i}", "answer": f"a{i}"}) for i in range(size)]
+        return examples[:1], examples[1:]
+
+    train, val = load(3)
+    train[0]["prediction"] = "attached"
+    val.clear()
+
+    train_again, val_again = load(3)
+    assert calls == [3]
+    assert "prediction" not in train_again[0]
+    assert len(val_again) == 2
+    assert dict(train_again[0].inputs()) == {"goal": "q0"}
@@ -221,6 +221,34 @@ class TestE2BToolkit:
         assert data["exit_code"] == 0
         assert data["stdout"] == "Success!"
 
+    @patch.dict(os.environ, {"E2B_API_KEY": "test_api_key_12345"})
+    @pytest.mark.asyncio
+    async def test_run_command_dict(self, mock_e2b):
+        """Test dict-returning command execution matches the JSON tool."""
+        mock_sandbox = MockAsyncSandbox()
+        mock_result = MockCommandResult(exit_code=0, stdout="Success!", stderr="")
+        mock_sandbox.commands.run.return_value = mock_result
+        mock_e2b.create.return_value = mock_sandbox
+
+        toolkit = E2BToolkit()
+        data = await toolkit.run_command_dict("echo hello")
+
+        assert data["success"] is True
+        assert data["exit_code"] == 0
+        assert data["stdout"] == "Success!"
+        assert json.loads(await toolkit.run_command("echo hello")) == data
+
+    @patch.dict(os.environ, {"E2B_API_KEY": "test_api_key_12345"})
+    def test_dict_methods_not_exposed_as_tools(self, mock_e2b):
+        """Test dict-returning variants are not registered as agent tools."""
+        toolkit = E2BToolkit()
+        tool_names = toolkit.get_available_tool_names()
+
+        assert "run_command" in tool_names
+        assert "run_python_code" in tool_names
+        assert "get_sandbox_status" in tool_names
+        assert not tool_names & E2BToolkit._STRUCTURED_RESULT_METHODS
+
     @patch.dict(os.environ, {"E2B_API_KEY": "test_api_key_12345"})
     @pytest.mark.asyncio
     async def test_get_sandbox_status_no_sandbox(self, mock_e2b):
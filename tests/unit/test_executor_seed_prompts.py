@@ -0,0 +1,131 @@
+"""Unit tests for the SWE-Bench and TB2 executor seed prompts."""
+
+import hashlib
+import pickle
+
+import dspy
+import pytest
+
+from prompt_optimization.prompts.seed_prompts import (
+    executor_seed,
+    executor_swebench_seed,
+    executor_tb2_seed,
+)
+from prompt_optimization.prompts.seed_prompts._shared import (
+    DEMO_OUTPUT_CHAR_BUDGET,
+    DEMOS_PLACEHOLDER,
+    PROMPT_CHAR_BUDGET,
+    fingerprint,
+)
+from prompt_optimization.prompts.seed_prompts.executor_tb2_seed import (
+    EXECUTOR_TB2_PROMPT,
+    get_tb2_executor_config,
+)
+
+
+SEED_PROMPTS_AND_DEMOS = [
+    (
+        executor_swebench_seed.EXECUTOR_SWEBENCH_PROMPT,
+        executor_swebench_seed.EXECUTOR_SWEBENCH_DEMOS,
+    ),
+    (executor_tb2_seed.EXECUTOR_TB2_PROMPT, executor_tb2_seed.EXECUTOR_TB2_DEMOS),
+]
+
+
+@pytest.mark.parametrize("prompt,demos", SEED_PROMPTS_AND_DEMOS, ids=["swebench", "tb2"])
+def test_seed_size_budget(prompt, demos):
+    """Seed prompts and demo outputs stay within their character budgets."""
+    assert len(prompt) <= PROMPT_CHAR_BUDGET, "seed prompt exceeded its size budget"
+    assert sum(len(demo.output) for demo in demos) <= DEMO_OUTPUT_CHAR_BUDGET, (
+        "seed demos exceeded their size budget"
+    )
+
+
+# SHA-256 of prompts assembled from the shared fragments in _shared.py. Regenerate
+# only when a prompt change is intended; an unexpected mismatch means a fragment
+# edit altered the text sent to the LLM.
+PINNED_PROMPT_DIGESTS = [
+    (
+        executor_seed.EXECUTOR_PROMPT,
+        "1be66c1f03621aad1fd5f5db295e6c704848007a76be8f5cf8d45d8c29ddf455",
+    ),
+    (
+        executor_tb2_seed.EXECUTOR_TB2_PROMPT,
+        "539c846586a69739c08d7e242a58ad80f6823e13e18f5b60c2c1c2a3e4d8b2a8",
+    ),
+]
+
+
+@pytest.mark.parametrize("prompt,digest", PINNED_PROMPT_DIGESTS, ids=["executor", "tb2"])
+def test_assembled_prompt_digest(prompt, digest):
+    """Prompts built from shared fragments keep the exact text they had when inlined."""
+    assert hashlib.sha256(prompt.encode("utf-8")).hexdigest() == digest
+
+
+class TestExecutorTB2Prompt:
+    """Test suite for EXECUTOR_TB2_PROMPT content."""
+
+    def test_no_sampling_parameter_disclaimers(self):
+        """Unsupported sampling knobs are filtered by the LM config, not the prompt."""
+        assert "temperature" not in EXECUTOR_TB2_PROMPT
+        assert "top_p" not in EXECUTOR_TB2_PROMPT
+        assert "frequency_penalty" not in EXECUTOR_TB2_PROMPT
+
+
+class TestExecutorSeedConfigs:
+    """Test suite for the cached executor seed configs."""
+
+    def test_messages_template_breakpoint(self):
+        """The static prompt block is cache-marked and demos go in a separate block."""
+        config = get_tb2_executor_config()
+        prompt_block, demos_block = config["messages_template"]
+
+        assert prompt_block["content"] == EXECUTOR_TB2_PROMPT
+        assert prompt_block["cache_control"]["type"] == "ephemeral"
+        assert demos_block["content"] == DEMOS_PLACEHOLDER
+        assert "cache_control" not in demos_block
+
+    def test_fingerprint_covers_prompt_and_demos(self):
+        """The fingerprint is stable and changes when either the prompt or demos change."""
+        demos = [dspy.Example(goal="g", output="o").with_inputs("goal")]
+        base = fingerprint("prompt", demos)
+
+        assert base == fingerprint("prompt", [dspy.Example(goal="g", output="o")])
+        assert base != fingerprint("prompt!", demos)
+        assert base != fingerprint("prompt", [dspy.Example(goal="g", output="o2")])
+        assert len(get_tb2_executor_config()["fingerprint"]) == 32
+
+    def test_tb2_nano_variant_selected_by_model(self):
+        """nano-class models get the distilled prompt; others get the full prompt."""
+        nano = get_tb2_executor_config("openrouter/openai/gpt-5-nano")
+        full = get_tb2_executor_config("openrouter/openai/gpt-5")
+
+        assert nano["prompt"] == executor_tb2_seed.EXECUTOR_TB2_PROMPT_NANO
+        assert full["prompt"] == EXECUTOR_TB2_PROMPT
+        assert len(nano["prompt"]) < len(full["prompt"])
+        assert nano["fingerprint"] != full["fingerprint"]
+        assert get_tb2_executor_config() == full
+
+    def test_tb2_nano_prompt_is_self_contained(self):
+        """The nano prompt does not point at API sections it leaves out, and profiles can load it."""
+        from roma_dspy.core.utils import InstructionLoader
+
+        nano = InstructionLoader().load(
+            "prompt_optimization.prompts.seed_prompts.executor_tb2_seed:EXECUTOR_TB2_PROMPT_NANO"
+        )
+
+        assert nano == executor_tb2_seed.EXECUTOR_TB2_PROMPT_NANO
+        assert "Leverage vision APIs" not in nano
+        assert "Available LLM Provider APIs" not in nano
+        assert "max_output_tokens" in nano
+
+    def test_configs_are_independent_plain_dicts(self):
+        """Each call returns a new, picklable dict, so callers can't mutate the shared config."""
+        config = executor_swebench_seed.get_swebench_executor_config()
+        config["prompt"] = "changed"
+
+        assert type(config) is dict
+        assert executor_swebench_seed.get_swebench_executor_config()["prompt"] != "changed"
+        assert pickle.loads(pickle.dumps(get_tb2_executor_config()))["fingerprint"] == (
+            get_tb2_executor_config()["fingerprint"]
+        )
@@ -61,6 +61,23 @@ def test_base_module_defaults_when_not_specified(mock_lm):
     assert atomizer._lm.kwargs.get("cache") is True
 
 
+def test_base_module_passes_cache_control_injection_points(mock_lm):
+    """Test that prompt-caching breakpoints are forwarded to dspy.LM only when set."""
+    points = [{"location": "message", "role": "system"}]
+    agent_config = AgentConfig(
+        llm=LLMConfig(model="anthropic/claude-sonnet-4-5", cache_control_injection_points=points),
+        prediction_strategy="chain_of_thought",
+    )
+
+    atomizer = Atomizer(config=agent_config)
+    assert atomizer._lm.kwargs.get("cache_control_injection_points") == points
+
+    default_atomizer = Atomizer(
+        config=AgentConfig(llm=LLMConfig(model="gpt-4o-mini"), prediction_strategy="chain_of_thought")
+    )
+    assert "cache_control_injection_points" not in default_atomizer._lm.kwargs
+
+
 @pytest.fixture
 def mock_lm(monkeypatch):
     """Mock dspy.LM to capture initialization kwargs."""
@@ -0,0 +1,53 @@
+"""Unit tests for the experiment CLI's compile step."""
+
+import pytest
+
+from prompt_optimization.experiment_cli.run_experiment import compile_in_run
+
+
+class RecordingOptimizer:
+    """Optimizer stub that records compile() calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def compile(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return "optimized"
+
+
+def test_compile_in_run_without_mlflow():
+    """Without a run id, compile_in_run just forwards to optimizer.compile()."""
+    optimizer = RecordingOptimizer()
+
+    assert compile_in_run(optimizer, None, "student", trainset=[1], valset=[2]) == "optimized"
+    assert optimizer.calls == [(("student",), {"trainset": [1], "valset": [2]})]
+
+
+def test_compile_in_run_keeps_outer_run_active(tmp_path):
+    """The experiment's run stays active (and unfinished) after compile returns."""
+    mlflow = pytest.importorskip("mlflow")
+    mlflow.set_tracking_uri(f"file://{tmp_path}")
+
+    with mlflow.start_run() as run:
+        run_id = run.info.run_id
+        compile_in_run(RecordingOptimizer(), run_id, "student")
+
+        active_run = mlflow.active_run()
+        assert active_run is not None and active_run.info.run_id == run_id
+        assert mlflow.get_run(run_id).info.status == "RUNNING"
+        assert mlflow.get_run(run_id).info.end_time is None
+
+    assert mlflow.get_run(run_id).info.status == "FINISHED"
+
+
+def test_compile_in_run_rejects_inactive_run(tmp_path):
+    """Compiling outside the run's thread (no active run) fails instead of logging nowhere."""
+    mlflow = pytest.importorskip("mlflow")
+    mlflow.set_tracking_uri(f"file://{tmp_path}")
+
+    with mlflow.start_run() as run:
+        run_id = run.info.run_id
+
+    with pytest.raises(RuntimeError, match="not active on this thread"):
+        compile_in_run(RecordingOptimizer(), run_id, "student")
@@ -0,0 +1,61 @@
+"""Guard seed prompts and demos against double-encoded UTF-8 (mojibake)."""
+
+import importlib
+import pkgutil
+import re
+
+import pytest
+
+import prompt_optimization.prompts.seed_prompts as seed_prompts
+
+NON_ASCII_RUN = re.compile(r"[^\x00-\x7f]+")
+
+SEED_MODULES = sorted(
+    info.name for info in pkgutil.iter_modules(seed_prompts.__path__)
+)
+
+
+def _mojibake_runs(text):
+    """Return non-ASCII runs that are UTF-8 bytes mis-decoded as cp1252 (e.g. 'â€”')."""
+    runs = []
+    for run in NON_ASCII_RUN.findall(text):
+        try:
+            repaired = run.encode("cp1252").decode("utf-8")
+        except UnicodeError:
+            continue  # Not representable as cp1252 bytes of valid UTF-8: genuine text
+        if repaired != run:
+            runs.append(run)
+    return runs
+
+
+def _strings(value):
+    """Yield every string inside a seed module constant (prompts, demos, nested fields)."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _strings(item)
+    elif hasattr(value, "toDict"):
+        yield from _strings(value.toDict())
+    elif hasattr(value, "model_dump"):
+        yield from _strings(value.model_dump())
+
+
+def test_mojibake_detector():
+    """The detector flags double-encoded text and accepts genuine non-ASCII."""
+    assert _mojibake_runs("Planner â€” SWE-Bench") == ["â€”"]
+    assert _mojibake_runs("Planner — SWE-Bench ✓ café →") == []
+
+
+@pytest.mark.parametrize("module_name", SEED_MODULES)
+def test_seed_module_has_no_mojibake(module_name):
+    """Seed prompt/demo constants contain no double-encoded characters."""
+    module = importlib.import_module(f"{seed_prompts.__name__}.{module_name}")
+    for attr, value in vars(module).items():
+        if not attr.isupper():
+            continue
+        for text in _strings(value):
+            assert not _mojibake_runs(text), f"{module_name}.{attr} contains mojibake"
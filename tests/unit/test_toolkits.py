@@ -127,6 +127,73 @@ class TestBaseToolkit:
         toolkit.log_warning("Warning message")
 
 
+class TestFileToolkitBatchRead:
+    """Test FileToolkit.read_files with execution-scoped FileStorage."""
+
+    def test_read_files_batch(self, tmp_path):
+        """Test reading several files in one call."""
+        from roma_dspy.config.schemas.storage import StorageConfig
+        from roma_dspy.core.storage.file_storage import FileStorage
+
+        file_storage = FileStorage(
+            config=StorageConfig(base_path=str(tmp_path)), execution_id="test"
+        )
+        toolkit = FileToolkit(file_storage=file_storage)
+        toolkit.save_file("a.txt", "alpha")
+        toolkit.save_file("b.txt", "beta")
+
+        data = json.loads(toolkit.read_files(["a.txt", "b.txt"]))
+        assert data["success"] is True
+        assert data["count"] == 2
+        assert [f["content"] for f in data["files"]] == ["alpha", "beta"]
+
+        # A missing file is reported per path without failing the others
+        data = json.loads(toolkit.read_files(["a.txt", "missing.txt"]))
+        assert data["success"] is False
+        assert data["files"][0]["content"] == "alpha"
+        assert data["files"][1]["success"] is False
+        assert data["truncated"] is False
+
+    def test_read_files_max_files(self, tmp_path):
+        """Test paths beyond read_files_max_files are skipped, not read."""
+        from roma_dspy.config.schemas.storage import StorageConfig
+        from roma_dspy.core.storage.file_storage import FileStorage
+
+        file_storage = FileStorage(
+            config=StorageConfig(base_path=str(tmp_path)), execution_id="test"
+        )
+        toolkit = FileToolkit(file_storage=file_storage, read_files_max_files=2)
+        for name in ("a.txt", "b.txt", "c.txt"):
+            toolkit.save_file(name, name)
+
+        data = json.loads(toolkit.read_files(["a.txt", "b.txt", "c.txt"]))
+        assert data["count"] == 2
+        assert data["truncated"] is True
+        assert data["skipped"] == ["c.txt"]
+        assert "at most 2 files" in data["note"]
+
+    def test_read_files_max_bytes(self, tmp_path):
+        """Test the file crossing read_files_max_bytes is cut and later paths are skipped."""
+        from roma_dspy.config.schemas.storage import StorageConfig
+        from roma_dspy.core.storage.file_storage import FileStorage
+
+        file_storage = FileStorage(
+            config=StorageConfig(base_path=str(tmp_path)), execution_id="test"
+        )
+        toolkit = FileToolkit(file_storage=file_storage, read_files_max_bytes=8)
+        toolkit.save_file("a.txt", "alpha")
+        toolkit.save_file("b.txt", "bravo")
+        toolkit.save_file("c.txt", "charlie")
+
+        data = json.loads(toolkit.read_files(["a.txt", "b.txt", "c.txt"]))
+        assert data["truncated"] is True
+        assert data["count"] == 2
+        assert data["files"][0]["content"] == "alpha"
+        assert data["files"][1]["truncated"] is True
+        assert data["files"][1]["content"].startswith("bra\n... [truncated: read_files byte limit of 8")
+        assert data["skipped"] == ["c.txt"]
+
+
 class TestFileToolkit:
     """Test FileToolkit functionality."""
 
@@ -147,6 +214,7 @@ class TestFileToolkit:
         expected_tools = {
             "save_file",
             "read_file",
+            "read_files",
             "list_files",
             "search_files",
             "create_directory",
@@ -0,0 +1,60 @@
+"""Unit tests for the .env handling in docker/e2b/validate_e2b_setup.py."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "docker" / "e2b" / "validate_e2b_setup.py"
+
+
+@pytest.fixture(scope="module")
+def validate_module():
+    """Load the validation script as a module (docker/e2b is not a package)."""
+    spec = importlib.util.spec_from_file_location("validate_e2b_setup", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_load_env_file_quotes_and_inline_comments(validate_module, tmp_path):
+    """Quoted values are kept verbatim; unquoted values lose trailing comments."""
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# full-line comment\n"
+        "PLAIN=value  # note\n"
+        "export EXPORTED=abc\n"
+        "HASH_IN_VALUE=abc#def\n"
+        "DOUBLE=\"quoted # not a comment\"  # note\n"
+        "SINGLE='single value'\n"
+        "EMPTY=\n"
+        "not a variable\n"
+    )
+
+    assert validate_module._load_env_file(env_file) == {
+        "PLAIN": "value",
+        "EXPORTED": "abc",
+        "HASH_IN_VALUE": "abc#def",
+        "DOUBLE": "quoted # not a comment",
+        "SINGLE": "single value",
+        "EMPTY": "",
+    }
+
+
+def test_env_file_takes_precedence_over_process_env(validate_module, tmp_path, monkeypatch):
+    """.env values win over the parent shell; empty .env values fall back to it."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("E2B_API_KEY=from-file\nAWS_REGION=\n")
+    monkeypatch.setenv("E2B_API_KEY", "from-shell")
+    monkeypatch.setenv("AWS_REGION", "us-west-2")
+
+    validator = validate_module.E2BValidator(skip_build=True, skip_s3=True)
+    validator.env_file = env_file
+    validator.env_file_exists = True
+    validator.env_file_values = validate_module._load_env_file(env_file)
+    validator.validate_env_vars()
+
+    assert validator.env_vars["E2B_API_KEY"] == "from-file"
+    assert validator.env_vars["AWS_REGION"] == "us-west-2"
+    assert validate_module.os.environ["E2B_API_KEY"] == "from-file"
+    assert validate_module.os.environ["AWS_REGION"] == "us-west-2"